@@ -1,12 +1,23 @@
 from dataclasses import dataclass
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from typing import Optional, Dict, List, Literal, Union
+from contextlib import ExitStack, contextmanager
+from typing import Optional, Dict, Iterable, Iterator, List, Literal, TextIO, Tuple, Union
+from itertools import chain
+from urllib.parse import quote
+import filecmp
+import gzip
+import hashlib
+import json
+import keyword
 import tomllib
 import sys
 import logging
 import argparse
 import os
+import re
+import shutil
+import tempfile
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -22,46 +33,223 @@ class IconConfig:
         """Get sprite path from environment or use default"""
         return Path(os.getenv('FT_ICON_OUTPUT_DIR', 'static')) / 'sprite.svg'
     
-def build_sprites(icons_dir: Path, output_dir: Path, types_path: Optional[Path] = None) -> None:
-    """Build SVG sprite sheet from individual SVG files"""
+# Short symbol ids start with this, so they don't clash with ids inside icon
+# bodies (minified SVGs often use "a" or "g") or with the page's own ids
+_SHORT_ID_PREFIX = "_"
+
+# (category, icon name, compiled <symbol>) flowing through the build pipeline
+SymbolItem = Tuple[str, str, ET.Element]
+
+def build_sprites(icons_dir: Path, output_dir: Path, types_path: Optional[Path] = None,
+                  css_path: Optional[Path] = None, pretty: bool = True,
+                  collections: Iterable[Path] = (), include: Optional[List[str]] = None,
+                  short_ids: bool = False) -> None:
+    """Build SVG sprite sheet, and optionally a mask-image stylesheet, from individual SVG files
+    and Iconify JSON collections
+    
+    Icons are compiled and written one at a time, so memory use stays flat however
+    many icons there are. Outputs replace their targets only once fully written.
+    With short_ids, symbols get compact base-36 ids recorded in the manifest.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Create root SVG element with proper namespace
-    root_svg = ET.Element("svg", {
-        "xmlns": "http://www.w3.org/2000/svg",
-        "style": "display:none"
-    })
+    # Use the same sprite path method
+    sprite_path = IconConfig.get_sprite_path()
     
-    categories: Dict[str, List[str]] = {}
+    with ExitStack() as stack:
+        # Entered first so the sprite is replaced last, after the manifest it is read with
+        sprite_file = stack.enter_context(_atomic_write(sprite_path))
+        symbols = chain(
+            _iter_symbols(icons_dir),
+            *(_iter_collection_symbols(path, include) for path in collections),
+        )
+        
+        # Generate types if path provided
+        if types_path:
+            _write_types_shim(stack.enter_context(_atomic_write(types_path.with_suffix(".py"))))
+            stub_file = stack.enter_context(_atomic_write(types_path.with_suffix(".pyi")))
+            symbols = _generate_types(stub_file, symbols)
+        
+        # Generate mask stylesheet if path provided
+        if css_path:
+            symbols = _write_css_file(stack.enter_context(_atomic_write(css_path)), symbols)
+        
+        # Short ids replace symbol ids, so they are assigned after the outputs keyed by name
+        ids = _read_manifest(sprite_path.parent).get("ids", {}) if short_ids else None
+        if short_ids:
+            symbols = _assign_short_ids(symbols, ids)
+        
+        symbols = _write_sprite_file(sprite_file, symbols, pretty)
+        count = sum(1 for _ in symbols)
+        _update_manifest(sprite_path.parent, ids=ids)
     
+    logger.info(f"Compiled {count} icons")
+
+def _iter_symbols(icons_dir: Path) -> Iterator[SymbolItem]:
+    """Compile each SVG file under icons_dir into a symbol as it is reached"""
     for svg_file in icons_dir.rglob("*.svg"):
         category = svg_file.parent.name if svg_file.parent.name != icons_dir.name else "icons"
         icon_name = svg_file.stem
         
         try:
             symbol = _create_symbol_from_svg(svg_file, f"{category}/{icon_name}")
-            root_svg.append(symbol)
-            
-            # Track for type generation
-            categories.setdefault(category, []).append(icon_name)
-            
         except ET.ParseError as e:
             logger.error(f"Failed to parse {svg_file}: {e}")
             continue
+        
+        yield category, icon_name, symbol
+
+def _iter_collection_symbols(collection_path: Path, include: Optional[List[str]] = None) -> Iterator[SymbolItem]:
+    """Compile icons and aliases from an Iconify JSON collection without touching disk
     
-    # Use the same sprite path method
-    sprite_path = IconConfig.get_sprite_path()
-    _write_sprite_file(sprite_path, root_svg)
+    include selects a subset by exact name, or by prefix for entries ending in "*".
+    Icons are namespaced under the collection prefix, e.g. Icon("mdi/home").
+    Icons Iconify marks hidden are compiled too, as they are kept for existing uses.
+    """
+    with open(collection_path, encoding='utf-8') as f:
+        collection = json.load(f)
+    
+    category = collection.get("prefix") or collection_path.stem
+    icons = collection.get("icons", {})
+    aliases = collection.get("aliases", {})
+    defaults = {"left": 0, "top": 0, "width": 16, "height": 16}
+    defaults.update({key: collection[key] for key in defaults if key in collection})
+    
+    for icon_name in chain(icons, aliases):
+        if include and not any(
+            icon_name.startswith(pattern[:-1]) if pattern.endswith("*") else icon_name == pattern
+            for pattern in include
+        ):
+            continue
+        
+        data = _resolve_collection_icon(icon_name, icons, aliases)
+        if data is None:
+            logger.error(f"Alias '{icon_name}' in {collection_path} has no parent icon")
+            continue
+
+        view_box, body = _transform_collection_body({**defaults, **data})
+        try:
+            svg_root = ET.fromstring(
+                f'<svg xmlns="http://www.w3.org/2000/svg" '
+                f'xmlns:xlink="http://www.w3.org/1999/xlink" viewBox="{view_box}">'
+                f'{body}</svg>'
+            )
+        except ET.ParseError as e:
+            logger.error(f"Failed to parse '{icon_name}' in {collection_path}: {e}")
+            continue
+        
+        yield category, icon_name, _create_symbol(svg_root, f"{category}/{icon_name}")
+
+def _resolve_collection_icon(name: str, icons: Dict[str, dict], aliases: Dict[str, dict],
+                             depth: int = 0) -> Optional[dict]:
+    """Resolve an icon or (possibly chained) alias into icon data"""
+    if name in icons:
+        return dict(icons[name])
+    
+    alias = aliases.get(name)
+    if alias is None or depth > len(aliases):
+        return None
+    parent = _resolve_collection_icon(alias.get("parent", ""), icons, aliases, depth + 1)
+    if parent is None:
+        return None
+    
+    # Alias transformations combine with the parent's, other props override them
+    resolved = {**parent, **{k: v for k, v in alias.items() if k not in ("parent", "rotate", "hFlip", "vFlip")}}
+    resolved["rotate"] = (parent.get("rotate", 0) + alias.get("rotate", 0)) % 4
+    resolved["hFlip"] = parent.get("hFlip", False) != alias.get("hFlip", False)
+    resolved["vFlip"] = parent.get("vFlip", False) != alias.get("vFlip", False)
+    return resolved
+
+def _transform_collection_body(props: dict) -> Tuple[str, str]:
+    """Apply Iconify rotate/hFlip/vFlip transformations, returning (viewBox, body)
+    
+    Mirrors Iconify's own rendering: flips move the box to the origin, quarter
+    turns rotate around Iconify's centres and swap the viewBox width and height.
+    """
+    left, top, width, height = (props[key] for key in ("left", "top", "width", "height"))
+    rotate = props.get("rotate", 0)
+    
+    transforms = []
+    if props.get("hFlip") and props.get("vFlip"):
+        rotate += 2
+    elif props.get("hFlip"):
+        transforms.append(f"translate({_num(width + left)} {_num(-top)}) scale(-1 1)")
+        left = top = 0
+    elif props.get("vFlip"):
+        transforms.append(f"translate({_num(-left)} {_num(height + top)}) scale(1 -1)")
+        left = top = 0
+    
+    rotate %= 4
+    if rotate == 1:
+        center = _num(height / 2 + top)
+        transforms.insert(0, f"rotate(90 {center} {center})")
+    elif rotate == 2:
+        transforms.insert(0, f"rotate(180 {_num(width / 2 + left)} {_num(height / 2 + top)})")
+    elif rotate == 3:
+        center = _num(width / 2 + left)
+        transforms.insert(0, f"rotate(-90 {center} {center})")
+    if rotate % 2:
+        left, top, width, height = top, left, height, width
+    
+    view_box = " ".join(_num(value) for value in (left, top, width, height))
+    body = props["body"]
+    return view_box, f'<g transform="{" ".join(transforms)}">{body}</g>' if transforms else body
+
+def _num(value: float) -> str:
+    """Format a number for SVG attributes without a trailing .0"""
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+def _assign_short_ids(symbols: Iterable[SymbolItem], ids: Dict[str, str]) -> Iterator[SymbolItem]:
+    """Replace symbol ids with stable prefixed base-36 indices, recording new ones in ids"""
+    # Ids recorded before the prefix was added keep their index
+    for name, short_id in ids.items():
+        if not short_id.startswith(_SHORT_ID_PREFIX):
+            ids[name] = _SHORT_ID_PREFIX + short_id
+    next_index = max(
+        (int(short_id[len(_SHORT_ID_PREFIX):], 36) for short_id in ids.values()), default=-1
+    ) + 1
+    for item in symbols:
+        symbol = item[2]
+        name = symbol.get("id")
+        if name not in ids:
+            ids[name] = _SHORT_ID_PREFIX + _to_base36(next_index)
+            next_index += 1
+        symbol.set("id", ids[name])
+        yield item
+
+def _to_base36(index: int) -> str:
+    digits = "0123456789abcdefghijklmnopqrstuvwxyz"
+    short_id = ""
+    while True:
+        index, remainder = divmod(index, 36)
+        short_id = digits[remainder] + short_id
+        if not index:
+            return short_id
+
+@contextmanager
+def _atomic_write(path: Path) -> Iterator[TextIO]:
+    """Write to a temporary file that replaces path only if writing succeeds
     
-    # Generate types if path provided
-    if types_path:
-        _generate_types(types_path, categories)
+    An unchanged file is left untouched, so its mtime doesn't trigger bytecode
+    recompiles, live reloaders or sprite hot reloads.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            yield f
+        if not (path.exists() and filecmp.cmp(tmp_path, path, shallow=False)):
+            os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
 
 def _create_symbol_from_svg(svg_file: Path, symbol_id: str) -> ET.Element:
     """Create a symbol element from an SVG file"""
     tree = ET.parse(svg_file)
-    svg_root = tree.getroot()
-    
+    return _create_symbol(tree.getroot(), symbol_id)
+
+def _create_symbol(svg_root: ET.Element, symbol_id: str) -> ET.Element:
+    """Create a symbol element from a parsed SVG root"""
     # Create symbol with basic attributes
     symbol = ET.Element("symbol")
     symbol.set("id", symbol_id.replace("_", "-").replace("/", "."))
@@ -141,33 +329,205 @@ def parse_style_attribute(style_str: str) -> Dict[str, str]:
         if ":" in item
     )
 
-def _write_sprite_file(sprite_path: Path, root_svg: ET.Element) -> None:
-    """Write the sprite file with clean XML output"""
-    tree = ET.ElementTree(root_svg)
-    ET.indent(tree, space="  ")
-    
-    with open(sprite_path, 'w', encoding='utf-8') as f:
-        f.write('<?xml version="1.0" encoding="utf-8"?>\n')
-        f.write(ET.tostring(root_svg, encoding='unicode', method='xml'))
-
-def _generate_types(types_path: Path, categories: Dict[str, List[str]]) -> None:
-    """Generate a Python file with type hints"""
-    with open(types_path, 'w', encoding='utf-8') as f:
-        f.write("# Generated file - do not edit directly\n\n")
-        f.write("from typing import Protocol\n")
-        f.write("from ft_icon.icon import Icon\n\n")                
+def _write_sprite_file(f: TextIO, symbols: Iterable[SymbolItem], pretty: bool = True) -> Iterator[SymbolItem]:
+    """Stream symbols into the sprite file, passing each one on once written"""
+    newline = "\n" if pretty else ""
+    f.write('<?xml version="1.0" encoding="utf-8"?>\n')
+    f.write(f'<svg xmlns="http://www.w3.org/2000/svg" style="display:none">{newline}')
+    
+    for item in symbols:
+        symbol = item[2]
+        if pretty:
+            ET.indent(symbol, space="  ", level=1)
+            f.write("  ")
+        f.write(ET.tostring(symbol, encoding='unicode', method='xml'))
+        f.write(newline)
+        yield item
+    
+    f.write("</svg>")
+
+def build_bundles(usage_path: Path) -> Dict[str, dict]:
+    """Build per-route sprite bundles from a usage log recorded by the middleware
+    
+    Each route gets a gzipped, content-hashed sprite holding only the symbols it
+    rendered. Routes with the same icons share a bundle. The bundles are recorded
+    in the manifest next to the sprite.
+    """
+    routes: Dict[str, set] = {}
+    with open(usage_path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                entry = json.loads(line)
+                routes.setdefault(entry["route"], set()).update(entry["icons"])
+    
+    sprite_path = IconConfig.get_sprite_path()
+    wanted = set().union(*routes.values())
+    
+    # Usage is recorded by name, the sprite may use short ids
+    ids = _read_manifest(sprite_path.parent).get("ids", {})
+    names = {ids.get(name, name): name for name in wanted}
+    symbols = {
+        names[symbol_id]: symbol
+        for symbol_id, symbol in _iter_sprite_symbols(sprite_path, names.keys())
+    }
+    if missing := wanted - symbols.keys():
+        logger.warning(f"Recorded icons missing from sprite: {sorted(missing)}")
+    
+    bundles_dir = sprite_path.parent / "bundles"
+    bundles_dir.mkdir(parents=True, exist_ok=True)
+    
+    bundles = {}
+    for route, icon_ids in sorted(routes.items()):
+        icon_ids = sorted(icon_ids & symbols.keys())
+        content = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            + "".join(symbols[icon_id] for icon_id in icon_ids)
+            + "</svg>"
+        ).encode()
+        file_name = f"{hashlib.sha256(content).hexdigest()[:12]}.svg"
         
-        f.write("class IconClass(Protocol):\n")
-        f.write('    """Available icon methods"""\n')
+        bundle_path = bundles_dir / file_name
+        if not bundle_path.exists():
+            bundle_path.write_bytes(content)
+            bundle_path.with_name(f"{file_name}.gz").write_bytes(gzip.compress(content, mtime=0))
         
-        for category, icons in categories.items():
-            for icon in icons:
-                name = icon.replace("-", "_").lower()
+        bundles[route] = {"file": f"bundles/{file_name}", "icons": icon_ids}
+    
+    _update_manifest(sprite_path.parent, bundles=bundles)
+    return bundles
+
+def _iter_sprite_symbols(sprite_path: Path, wanted: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Stream (id, compact XML) for the wanted symbols of a built sprite"""
+    wanted = set(wanted)
+    for _, elem in ET.iterparse(sprite_path):
+        if elem.tag.split('}')[-1] != "symbol":
+            continue
+        if elem.get("id") in wanted:
+            for child in elem.iter():
+                child.tag = child.tag.split('}')[-1]
+                child.tail = None
+                if child.text and not child.text.strip():
+                    child.text = None
+            yield elem.get("id"), ET.tostring(elem, encoding='unicode')
+        elem.clear()
+
+def _read_manifest(output_dir: Path) -> dict:
+    """Read the build manifest next to the sprite, if there is one"""
+    manifest_path = output_dir / "manifest.json"
+    return json.loads(manifest_path.read_text(encoding='utf-8')) if manifest_path.exists() else {}
+
+def _update_manifest(output_dir: Path, **sections) -> None:
+    """Merge sections into the build manifest next to the sprite, dropping ones set to None"""
+    manifest = _read_manifest(output_dir)
+    if not manifest and all(value is None for value in sections.values()):
+        return
+    manifest.update(sections)
+    manifest = {key: value for key, value in manifest.items() if value is not None}
+    
+    with _atomic_write(output_dir / "manifest.json") as f:
+        json.dump(manifest, f, indent=2)
+
+def css_class_name(symbol_id: str) -> str:
+    """Get the mask stylesheet class for a symbol id, e.g. icons.home -> icon-home
+    
+    Categories are joined with "_", which symbol ids never contain, so data.display
+    (icon-data_display) can't collide with icons.data-display (icon-data-display).
+    """
+    category, _, name = symbol_id.rpartition(".")
+    return f"icon-{name}" if category in ("", "icons") else f"icon-{category}_{name}"
+
+def _symbol_to_data_uri(symbol: ET.Element) -> str:
+    """Render a symbol as a standalone, URL-encoded SVG data URI"""
+    svg = ET.Element("svg", {
+        "xmlns": "http://www.w3.org/2000/svg",
+        "viewBox": symbol.get("viewBox", "0 0 24 24"),
+    })
+    # Keep the symbol's presentation attributes on a group so the mask shape matches
+    group_attrs = {
+        key: value for key, value in symbol.attrib.items()
+        if key not in ("id", "viewBox") and not key.startswith("data-")
+    }
+    parent = ET.SubElement(svg, "g", group_attrs) if group_attrs else svg
+    parent.extend(symbol)
+    
+    markup = ET.tostring(svg, encoding="unicode", short_empty_elements=True)
+    markup = re.sub(r">\s+<", "><", " ".join(markup.split()))
+    if "'" not in markup:
+        markup = markup.replace('"', "'")
+    return "data:image/svg+xml," + quote(markup, safe=" '=:/;,.-")
+
+def _write_css_file(f: TextIO, symbols: Iterable[SymbolItem]) -> Iterator[SymbolItem]:
+    """Stream one mask-image class per symbol into the stylesheet"""
+    f.write("/* Generated file - do not edit directly */\n")
+    f.write(
+        ".ft-icon{display:inline-block;background-color:currentColor;"
+        "-webkit-mask:var(--ft-icon) no-repeat center/100% 100%;"
+        "mask:var(--ft-icon) no-repeat center/100% 100%}\n"
+    )
+    seen = set()
+    for item in symbols:
+        symbol = item[2]
+        class_name = css_class_name(symbol.get("id"))
+        if class_name in seen:
+            logger.error(f"Duplicate icon {symbol.get('id')}, keeping the first stylesheet class")
+            yield item
+            continue
+        seen.add(class_name)
+        f.write(f'.{class_name}{{--ft-icon:url("{_symbol_to_data_uri(symbol)}")}}\n')
+        yield item
+
+def _generate_types(f: TextIO, symbols: Iterable[SymbolItem]) -> Iterator[SymbolItem]:
+    """Stream a .pyi stub with a Literal name for each icon, and a method for each one
+    the Icon class resolves as an attribute
+    
+    Only the icons category is reachable as Icon.<name>(), and only through names
+    that are valid identifiers. Other icons are typed through IconName alone.
+    """
+    f.write("# Generated file - do not edit directly\n\n")
+    f.write("from typing import Literal, Protocol\n")
+    f.write("from ft_icon.icon import Icon\n\n")                
+    
+    f.write("class IconClass(Protocol):\n")
+    f.write('    """Available icon methods"""\n')
+    
+    # Names are spooled aside so the Literal can follow the class without holding them all
+    methods = set()
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as names:
+        for item in symbols:
+            symbol_id = item[2].get("id")
+            # Icon.<name> looks up "icons.<name>" with underscores turned into dashes
+            name = symbol_id.removeprefix("icons.").replace("-", "_")
+            if (item[0] == "icons" and name.isidentifier() and not keyword.iskeyword(name)
+                    and not name.startswith("_") and name not in methods):
+                methods.add(name)
                 f.write(f"    @classmethod\n")
                 f.write(f"    def {name}(cls, *args, **kwargs) -> Icon: ...\n")
+            names.write(f'    "{symbol_id}",\n')
+            yield item
         
-        f.write("\n# Type hint for Icon class\n")
-        f.write("IconType = IconClass\n")
+        if not methods:
+            f.write("    ...\n")
+        f.write("\n# Symbol ids accepted by Icon(name=...)\n")
+        if names.tell():
+            f.write("IconName = Literal[\n")
+            names.seek(0)
+            shutil.copyfileobj(names, f)
+            f.write("]\n")
+        else:
+            f.write("IconName = str\n")
+    
+    f.write("\n# Type hint for Icon class\n")
+    f.write("IconType = IconClass\n")
+
+def _write_types_shim(f: TextIO) -> None:
+    """Write the runtime module behind the .pyi stub, kept trivial to import"""
+    f.write("# Generated file - do not edit directly\n")
+    f.write("# Icon methods and names are declared in the .pyi stub next to this file\n\n")
+    f.write("from typing import Protocol\n\n")
+    f.write("class IconClass(Protocol):\n")
+    f.write('    """Available icon methods"""\n\n')
+    f.write("IconName = str\n")
+    f.write("IconType = IconClass\n")
 
 def main() -> None:
     """CLI entry point - builds sprites"""
@@ -175,6 +535,14 @@ def main() -> None:
     parser.add_argument('--icons-dir', help='Icons source directory')
     parser.add_argument('--output-dir', help='Output directory')
     parser.add_argument('--types-path', help='Path for generated types file')
+    parser.add_argument('--css-path', help='Path for generated mask-image stylesheet')
+    parser.add_argument('--compact', action='store_true', help='Write the sprite without indentation')
+    parser.add_argument('--collection', action='append', default=[],
+                        help='Iconify JSON collection to import (repeatable)')
+    parser.add_argument('--include', action='append',
+                        help='Collection icon name, or prefix ending in *, to import (repeatable)')
+    parser.add_argument('--from-usage', help='Build per-route bundles from a recorded usage log')
+    parser.add_argument('--short-ids', action='store_true', help='Use compact base-36 symbol ids')
     
     args = parser.parse_args()
     cwd = Path.cwd()
@@ -188,18 +556,37 @@ def main() -> None:
         output_dir=Path(args.output_dir or os.getenv('FT_ICON_OUTPUT_DIR') or cwd / 'static'),
         types_path=Path(args.types_path or os.getenv('FT_ICON_TYPES_PATH') or cwd / 'icon_types.py')
     )
+    if args.from_usage:
+        bundles = build_bundles(Path(args.from_usage))
+        logger.info(f"✅ Built {len(set(b['file'] for b in bundles.values()))} bundles for {len(bundles)} routes")
+        return
+    
+    css_path = args.css_path or os.getenv('FT_ICON_CSS_PATH')
+    collections = [Path(p) for p in args.collection or os.getenv('FT_ICON_COLLECTIONS', '').split(os.pathsep) if p]
     
     logger.info(f"📁 Icons directory: {config.icons_dir}")
     logger.info(f"📂 Output directory: {config.output_dir}")
     logger.info(f"📄 Types path: {config.types_path}")
     
-    if not config.icons_dir.exists():
+    for collection in collections:
+        logger.info(f"📦 Icon collection: {collection}")
+    
+    if not config.icons_dir.exists() and not collections:
         logger.error(f"Icons directory not found at {config.icons_dir}")
         sys.exit(1)
+    
+    missing = [p for p in collections if not p.exists()]
+    if missing:
+        logger.error(f"Icon collection not found at {missing[0]}")
+        sys.exit(1)
         
-    build_sprites(config.icons_dir, config.output_dir, config.types_path)
+    build_sprites(config.icons_dir, config.output_dir, config.types_path,
+                  Path(css_path) if css_path else None, pretty=not args.compact,
+                  collections=collections, include=args.include, short_ids=args.short_ids)
     logger.info(f"✅ Built sprite file at {IconConfig.get_sprite_path()}")
-    logger.info(f"✅ Generated types at {config.types_path}")
+    logger.info(f"✅ Generated types at {config.types_path.with_suffix('.pyi')}")
+    if css_path:
+        logger.info(f"✅ Generated stylesheet at {css_path}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,6 +1,11 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Union
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping, Optional, Tuple, Union
+import threading
+
+from tw_merge import tw_merge
 
 class Size(str, Enum):
     XS = "xs"
@@ -21,10 +26,7 @@ class Size(str, Enum):
     @classmethod
     def add(cls, name: str):
         """Add a new size enum value"""
-        name = name.upper()
-        if not hasattr(cls, name):
-            cls._member_map_[name] = cls._value2member_map_[name.lower()] = cls(name.lower())
-        return getattr(cls, name)
+        return _add_member(cls, name)
 
 class Style(Enum):
     OG = ""  # No fill/stroke classes, preserve original colors
@@ -46,6 +48,34 @@ class Style(Enum):
     SIMPLE_FADED = "fill-current opacity-70"
     SOLID_FADED = "fill-current stroke-0 opacity-70"
     OUTLINE_FADED = "fill-none stroke-[1.5px] stroke-current opacity-70"
+    
+    @classmethod
+    def add(cls, name: str):
+        """Add a new style enum value, its classes live in config.styles"""
+        return _add_member(cls, name)
+
+def _add_member(enum_cls, name: str):
+    """Register a new member on an existing enum, keyed by its lowercase name"""
+    member = _get_member(enum_cls, name)
+    if member.name not in enum_cls._member_map_:
+        _register_member(enum_cls, member)
+    return member
+
+def _get_member(enum_cls, name: str):
+    """Get an enum's member by name, or create one without registering it yet"""
+    name, value = name.upper(), name.lower()
+    if name in enum_cls._member_map_:
+        return enum_cls._member_map_[name]
+    
+    member = str.__new__(enum_cls, value) if issubclass(enum_cls, str) else object.__new__(enum_cls)
+    member._name_, member._value_ = name, value
+    return member
+
+def _register_member(enum_cls, member) -> None:
+    """Make a member created by _get_member visible on its enum"""
+    type.__setattr__(enum_cls, member.name, member)
+    enum_cls._member_names_.append(member.name)
+    enum_cls._member_map_[member.name] = enum_cls._value2member_map_[member.value] = member
 
 # Default mappings
 DEFAULT_SIZES = {
@@ -87,33 +117,148 @@ DEFAULT_STYLES = {
     Style.OUTLINE_FADED: "fill-none stroke-[1.5px] stroke-current opacity-70",
 }
 
+RenderMode = Literal["sprite", "adaptive", "mask", "bundle"]
+
+@dataclass(frozen=True)
+class ClassTables:
+    """Size and style classes with their merged base classes, published together
+    
+    configure() builds a new instance and swaps it in with one assignment, so a
+    render that reads config.tables once never mixes old and new values.
+    """
+    sizes: Mapping[Union[Size, str], str]
+    styles: Mapping[Union[Style, str], str]
+    # Merged base classes for every Size x Style
+    base: Mapping[Tuple[Size, Style], str]
+    # The same for mask mode, with styles translated by mask_style_classes()
+    mask: Mapping[Tuple[Size, Style], str]
+
 @dataclass
 class IconConfig:
-    """Configuration for icon sizes and styles"""
-    sizes: Dict[Union[Size, str], str]
-    styles: Dict[Union[Style, str], str]
+    """Configuration for icon sizes, styles and page rendering"""
+    tables: ClassTables
+    # "sprite": every icon is a <use> of an injected <symbol>
+    # "adaptive": icons are inlined whenever that costs fewer bytes than a symbol
+    # "mask": icons are <span>s styled by the generated mask-image stylesheet
+    # "bundle": icons <use> the route's prebuilt sprite bundle from the manifest
+    render_mode: RenderMode = "sprite"
+    # Extra bytes an inlined icon may cost over its symbol form and still be inlined
+    inline_threshold: int = 0
+    # Seconds between checks for a rebuilt sprite file, 0 disables hot reload
+    reload_interval: float = 0
+    # JSON lines file the middleware records each route's icons to
+    usage_log: Optional[Path] = None
+    # URL the sprite output directory is served from
+    static_url: str = "/static"
+    
+    @property
+    def sizes(self) -> Mapping[Union[Size, str], str]:
+        return self.tables.sizes
+    
+    @property
+    def styles(self) -> Mapping[Union[Style, str], str]:
+        return self.tables.styles
+
+# Serializes configure() calls; renders never take it
+_configure_lock = threading.Lock()
+
+def mask_style_classes(style_classes: str) -> str:
+    """Translate fill/stroke style classes to what a masked <span> can show
+    
+    A mask icon is painted with currentColor, so fill/stroke colours become text
+    colours and opacity is kept. Stroke widths, fill-none and fill-opacity shape
+    the geometry itself and can't be expressed, so they are dropped.
+    """
+    classes = []
+    for cls in style_classes.split():
+        if cls.startswith("opacity-"):
+            classes.append(cls)
+            continue
+        prefix, _, color = cls.partition("-")
+        if prefix not in ("fill", "stroke") or not color:
+            continue
+        if color in ("current", "none") or color[0].isdigit() or color.startswith(("[", "opacity-", "rule-")):
+            continue
+        classes.append(f"text-{color}")
+    return " ".join(classes)
+
+def _build_class_table(sizes: Mapping, styles: Mapping, mask: bool = False) -> Mapping[Tuple[Size, Style], str]:
+    """Pre-merge the base classes of every Size x Style combination"""
+    return MappingProxyType({
+        (size, style): tw_merge(" ".join(
+            classes for classes in (
+                "inline-block",
+                mask_style_classes(style_classes) if mask else style_classes,
+                size_classes,
+            ) if classes
+        ))
+        for size, size_classes in sizes.items() if isinstance(size, Size)
+        for style, style_classes in styles.items() if isinstance(style, Style)
+    })
+
+def _build_tables(sizes: Dict, styles: Dict) -> ClassTables:
+    """Build read-only class tables for the given sizes and styles"""
+    return ClassTables(
+        sizes=MappingProxyType(sizes),
+        styles=MappingProxyType(styles),
+        base=_build_class_table(sizes, styles),
+        mask=_build_class_table(sizes, styles, mask=True),
+    )
 
 # Global configuration instance
-config = IconConfig(
-    sizes=DEFAULT_SIZES.copy(),
-    styles=DEFAULT_STYLES.copy(),
-)
+config = IconConfig(tables=_build_tables(DEFAULT_SIZES.copy(), DEFAULT_STYLES.copy()))
 
-def configure(*, sizes: Dict[str, str] = None, styles: Dict[str, str] = None):
+def configure(*, sizes: Dict[str, str] = None, styles: Dict[str, str] = None,
+              render_mode: RenderMode = None, inline_threshold: int = None,
+              reload_interval: float = None, usage_log: Union[Path, str] = None,
+              static_url: str = None):
     """Update the global icon configuration
     
     Updates existing enum mappings or creates new ones:
     configure(
         sizes={"huge": "h-20 w-20", "sm": "h-4 w-4"},  # "sm" overrides existing
-        styles={"fancy": "fill-current stroke-2", "simple": "fill-current"}  # "simple" overrides existing
+        styles={"fancy": "fill-current stroke-2", "simple": "fill-current"},  # "simple" overrides existing
+        render_mode="adaptive",  # inline single-use icons, share repeated ones
+        reload_interval=2,  # pick up rebuilt sprites without a restart
+        usage_log="icon_usage.jsonl",  # record icons per route for bundle builds
     )
     """
-    if sizes:
-        for name, classes in sizes.items():
-            size = Size.add(name) if name.upper() not in Size.__members__ else getattr(Size, name.upper())
-            config.sizes[size] = classes
+    if render_mode is not None:
+        if render_mode not in ("sprite", "adaptive", "mask", "bundle"):
+            raise ValueError(f"Unknown render mode: {render_mode}")
+        config.render_mode = render_mode
+        
+    if inline_threshold is not None:
+        config.inline_threshold = inline_threshold
+        
+    if reload_interval is not None:
+        config.reload_interval = reload_interval
+        if reload_interval:
+            # Imported here as icon.py depends on this module
+            from .icon import Icon
+            Icon.watch_sprite_file()
+        
+    if usage_log is not None:
+        config.usage_log = Path(usage_log)
+        
+    if static_url is not None:
+        config.static_url = static_url
+
+    if sizes or styles:
+        with _configure_lock:
+            # Build new tables off to the side, then publish them with one assignment
+            new_sizes, new_styles = dict(config.sizes), dict(config.styles)
+            
+            for name, classes in (sizes or {}).items():
+                new_sizes[_get_member(Size, name)] = classes
+                
+            for name, classes in (styles or {}).items():
+                new_styles[_get_member(Style, name)] = classes
+            
+            config.tables = _build_tables(new_sizes, new_styles)
             
-    if styles:
-        for name, classes in styles.items():
-            style = Style.add(name) if name.upper() not in Style.__members__ else getattr(Style, name.upper())
-            config.styles[style] = classes 
\ No newline at end of file
+            # New members become usable only once the tables hold their classes
+            for enum_cls, members in ((Size, new_sizes), (Style, new_styles)):
+                for member in members:
+                    if isinstance(member, enum_cls) and member.name not in enum_cls._member_map_:
+                        _register_member(enum_cls, member)
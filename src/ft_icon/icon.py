@@ -1,19 +1,57 @@
 from enum import Enum
-from dataclasses import dataclass
-from functools import lru_cache
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from typing import ClassVar, Set, Dict, Union, Callable
+from typing import Any, ClassVar, Set, Dict, Iterable, List, Optional, Tuple, Union, Callable
+from html import escape
+import json
 import logging
 import os
+import re
+import threading
+import time
 
 from fasthtml.common import Div, NotStr
 from tw_merge import tw_merge
-from .config import config, Size, Style
-from .build_sprite import IconConfig
+from .config import config, mask_style_classes, Size, Style
+from .build_sprite import IconConfig, css_class_name
 
 logger = logging.getLogger(__name__)
 
+# Matches the <svg><use/></svg> markup emitted by Icon.__ft__
+_USE_RE = re.compile(r'<svg class="([^"]*)" data-icon>\s*<use href="#([^"]+)"/>\s*</svg>')
+# Matches id attributes inside a symbol body
+_ID_RE = re.compile(r'\sid="')
+
+@dataclass(frozen=True)
+class _SpriteSnapshot:
+    """One consistent version of the loaded sprite and everything derived from it
+    
+    Published with a single assignment and never modified afterwards, apart from
+    the lazily filled inline cache, which is dropped together with the snapshot.
+    """
+    symbols: Dict[str, str] = field(default_factory=dict)
+    manifest: Dict[str, Any] = field(default_factory=dict)
+    # Icon name -> short id, and back, when the sprite uses short ids
+    short_ids: Dict[str, str] = field(default_factory=dict)
+    names: Dict[str, str] = field(default_factory=dict)
+    # (mtime, size) of the sprite and manifest it was loaded from, None until loaded
+    stamp: Optional[Tuple[int, ...]] = None
+    # (viewBox, body) per icon for adaptive inlining
+    inline_parts: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    
+    def icon_name(self, ref: str) -> str:
+        """Map a <use> reference back to its icon name"""
+        return self.names.get(ref, ref)
+    
+    def ref(self, icon_id: str) -> str:
+        """Get the id an icon is referenced by in the sprite"""
+        return self.short_ids.get(icon_id, icon_id)
+
+# Snapshot pinned by the middleware for the request being rendered
+_request_sprite: ContextVar[Optional[_SpriteSnapshot]] = ContextVar("ft_icon_sprite", default=None)
+
 class IconMeta(type):
     def __getattr__(cls, name: str) -> Callable[..., 'Icon']:
         """Handle dynamic icon method creation"""
@@ -52,7 +90,9 @@ class Icon(metaclass=IconMeta):
         self.cls = cls
     
     _page_icons: ClassVar[Set[str]] = set()
-    _symbol_cache: ClassVar[Dict[str, str]] = {}
+    _sprite: ClassVar[_SpriteSnapshot] = _SpriteSnapshot()
+    _reload_lock: ClassVar[threading.Lock] = threading.Lock()
+    _watcher: ClassVar[Optional[threading.Thread]] = None
     
     @classmethod
     def get_sprite_path(cls) -> Path:
@@ -64,7 +104,7 @@ class Icon(metaclass=IconMeta):
         """Create a method that returns a simple fallback for missing icons"""
         def fallback_method(*args, **kwargs):
             # Return an empty div if question icon isn't available
-            if "icons.question" not in cls._symbol_cache:
+            if "icons.question" not in cls._sprite.symbols:
                 return Div(cls="w-6 h-6")
             return cls(name="icons.question", cls="text-error")
         return fallback_method
@@ -77,14 +117,13 @@ class Icon(metaclass=IconMeta):
         symbol_id = f"icons.{normalized_name}"
         
         # Load sprite file if not already loaded
-        if not cls._symbol_cache:
-            cls._symbol_cache = cls._load_sprite_file()
+        symbols = cls._load_sprite_file().symbols
             
-        if symbol_id not in cls._symbol_cache:
+        if symbol_id not in symbols:
             # Try the underscore version as fallback
             alt_symbol_id = f"icons.{name}"
-            if alt_symbol_id not in cls._symbol_cache:
-                logger.debug(f"Icon '{name}' not found in available icons: {sorted(cls._symbol_cache.keys())}")
+            if alt_symbol_id not in symbols:
+                logger.debug(f"Icon '{name}' not found in available icons: {sorted(symbols.keys())}")
                 raise AttributeError(f"Icon '{name}' not found")
             symbol_id = alt_symbol_id
         
@@ -115,15 +154,88 @@ class Icon(metaclass=IconMeta):
         return icon_method
     
     @classmethod
-    @lru_cache
-    def _load_sprite_file(cls) -> Dict[str, str]:
-        """Load and parse the sprite file once, caching the result"""
-        sprite_path = IconConfig.get_sprite_path()
-        logger.info(f"Loading sprite file from: {sprite_path.absolute()}")
+    def _load_sprite_file(cls) -> _SpriteSnapshot:
+        """Load and parse the sprite file once, returning the current snapshot afterwards"""
+        if cls._sprite.stamp is None:
+            cls.reload_sprites(force=True)
+        return cls._sprite
+    
+    @classmethod
+    def _current_sprite(cls) -> _SpriteSnapshot:
+        """Get the snapshot pinned for the current request, or the latest loaded one"""
+        return _request_sprite.get() or cls._sprite
+    
+    @classmethod
+    def reload_sprites(cls, force: bool = False) -> bool:
+        """Reload the sprite file if it changed on disk since it was last loaded
         
-        if not sprite_path.exists():
-            logger.error(f"Sprite file not found at: {sprite_path.absolute()}")
-            raise FileNotFoundError("sprite.svg not found. Run build_sprites first.")
+        The new symbols, manifest and id maps are built off to the side and
+        published as one snapshot with a single assignment, so a response that
+        reads the snapshot once sees either the old or the new sprite, never a mix.
+        Returns True if the symbols were reloaded.
+        """
+        with cls._reload_lock:
+            sprite_path = IconConfig.get_sprite_path()
+            manifest_path = sprite_path.with_name("manifest.json")
+            try:
+                stat = sprite_path.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                logger.error(f"Sprite file not found at: {sprite_path.absolute()}")
+                raise FileNotFoundError("sprite.svg not found. Run build_sprites first.")
+            if manifest_path.exists():
+                stat = manifest_path.stat()
+                stamp += (stat.st_mtime_ns, stat.st_size)
+            
+            if not force and stamp == cls._sprite.stamp:
+                return False
+            
+            # The builder writes the manifest before replacing the sprite. The stamp
+            # is taken before reading either, so a sprite that lands mid-read gets
+            # picked up on the next check.
+            symbols = cls._parse_sprite_file(sprite_path)
+            manifest = (
+                json.loads(manifest_path.read_text(encoding='utf-8'))
+                if manifest_path.exists() else {}
+            )
+            # Short id sprites are still looked up by icon name
+            short_ids = manifest.get("ids", {})
+            names = {short_id: name for name, short_id in short_ids.items()}
+            symbols = {names.get(symbol_id, symbol_id): symbol for symbol_id, symbol in symbols.items()}
+            
+            cls._sprite = _SpriteSnapshot(
+                symbols=symbols, manifest=manifest,
+                short_ids=short_ids, names=names, stamp=stamp,
+            )
+            return True
+    
+    @classmethod
+    def watch_sprite_file(cls) -> None:
+        """Reload the sprite in a background thread whenever it changes on disk
+        
+        Polls every config.reload_interval seconds and stops once it is set to 0.
+        Started by configure(reload_interval=...) and by the middleware.
+        """
+        if cls._watcher and cls._watcher.is_alive():
+            return
+        
+        def watch():
+            while config.reload_interval:
+                time.sleep(config.reload_interval)
+                try:
+                    if cls.reload_sprites():
+                        logger.info(f"Reloaded {len(cls._sprite.symbols)} symbols from sprite file")
+                except Exception as e:
+                    # Keep serving the previous symbols until the next good build
+                    logger.error(f"Failed to reload sprite file: {e}")
+        
+        cls._watcher = threading.Thread(target=watch, name="ft-icon-sprite-watcher", daemon=True)
+        cls._watcher.start()
+    
+    @staticmethod
+    def _parse_sprite_file(sprite_path: Path) -> Dict[str, str]:
+        """Parse the sprite file into symbol XML strings keyed by id"""
+        logger.info(f"Loading sprite file from: {sprite_path.absolute()}")
         
         try:
             tree = ET.parse(sprite_path)
@@ -156,23 +268,26 @@ class Icon(metaclass=IconMeta):
             raise ValueError("Invalid sprite.svg format") from e
     
     @classmethod
-    def _load_symbol(cls, icon_id: str) -> str:
-        """Load symbol definition from sprite.svg"""
-        if not cls._symbol_cache:
-            cls._symbol_cache = cls._load_sprite_file()
+    def _load_symbol(cls, icon_id: str, symbols: Optional[Dict[str, str]] = None) -> str:
+        """Load symbol definition from sprite.svg, or from a snapshot of its symbols"""
+        if symbols is None:
+            symbols = cls._load_sprite_file().symbols
         # Convert any remaining / to . when looking up in cache
         cache_id = icon_id.replace("/", ".")
-        return cls._symbol_cache.get(cache_id, "")
+        return symbols.get(cache_id, "")
     
     @classmethod
-    def get_sprite_defs(cls) -> NotStr:
-        """Get SVG definitions for all icons used on the current page"""
-        if not cls._page_icons:
+    def get_sprite_defs(cls, icon_ids: Optional[Iterable[str]] = None,
+                        sprite: Optional[_SpriteSnapshot] = None) -> NotStr:
+        """Get SVG definitions for the given icons, or all icons used on the current page"""
+        icon_ids = cls._page_icons if icon_ids is None else list(icon_ids)
+        if not icon_ids:
             return NotStr("")
         
+        sprite = sprite or cls._load_sprite_file()
         symbols = [
-            cls._load_symbol(icon_id)
-            for icon_id in cls._page_icons
+            cls._load_symbol(icon_id, sprite.symbols)
+            for icon_id in icon_ids
         ]
         
         symbols = [s for s in symbols if s]  # Filter out empty symbols
@@ -184,6 +299,112 @@ class Icon(metaclass=IconMeta):
             </svg>
         """)
     
+    @classmethod
+    def _split_symbol(cls, icon_id: str, sprite: _SpriteSnapshot) -> Tuple[str, str]:
+        """Get an icon's viewBox and inline body, cached on the sprite snapshot"""
+        parts = sprite.inline_parts.get(icon_id)
+        if parts is None:
+            parts = sprite.inline_parts[icon_id] = cls._parse_inline_parts(sprite.symbols[icon_id])
+        return parts
+    
+    @staticmethod
+    def _parse_inline_parts(symbol_xml: str) -> Tuple[str, str]:
+        """Split symbol XML into its viewBox and the body to inline in its place"""
+        clean_xml = symbol_xml.replace('xmlns="http://www.w3.org/2000/svg"', '')
+        symbol = ET.fromstring(clean_xml)
+        children = ''.join(ET.tostring(child, encoding='unicode').strip() for child in symbol)
+        
+        # Presentation attributes stay on a wrapping group so they keep the
+        # same precedence against the icon classes as they have on the symbol
+        attrs = ''.join(
+            f' {key}="{escape(value)}"'
+            for key, value in symbol.attrib.items()
+            if key not in ('id', 'viewBox') and not key.startswith('data-')
+        )
+        body = f'<g{attrs}>{children}</g>' if attrs else children
+        return symbol.get('viewBox', '0 0 24 24'), body
+    
+    @classmethod
+    def render_adaptive(cls, html: str, sprite: Optional[_SpriteSnapshot] = None) -> Tuple[str, NotStr, int]:
+        """Inline icons wherever that is cheaper than sharing a symbol
+        
+        Counts the uses of each icon in the rendered page and compares the cost of
+        one <symbol> plus a <use> per occurrence with inlining every occurrence.
+        Icons with internal ids are only inlined when they are used once.
+        Returns the rewritten HTML, the defs for icons still referenced through
+        <use>, and the bytes saved compared to plain sprite rendering.
+        """
+        sprite = sprite or cls._load_sprite_file()
+        uses: Dict[str, List[re.Match]] = {}
+        for match in _USE_RE.finditer(html):
+            uses.setdefault(sprite.icon_name(match.group(2)), []).append(match)
+        
+        inlined: Dict[str, Tuple[str, str]] = {}
+        for icon_id, matches in uses.items():
+            symbol = cls._load_symbol(icon_id, sprite.symbols)
+            if not symbol:
+                continue
+            view_box, body = cls._split_symbol(icon_id.replace("/", "."), sprite)
+            # Inlining an icon with internal ids (gradients, clip paths) more than
+            # once would put duplicate ids in the page
+            if len(matches) > 1 and _ID_RE.search(body):
+                continue
+            symbol_cost = len(symbol) + sum(len(m.group(0)) for m in matches)
+            inline_cost = sum(
+                len(cls._inline_svg(m.group(1), view_box, body)) for m in matches
+            )
+            if inline_cost <= symbol_cost + config.inline_threshold:
+                inlined[icon_id] = (view_box, body)
+        
+        def replace(match: re.Match) -> str:
+            icon_id = sprite.icon_name(match.group(2))
+            if icon_id not in inlined:
+                return match.group(0)
+            return cls._inline_svg(match.group(1), *inlined[icon_id])
+        
+        rewritten = _USE_RE.sub(replace, html) if inlined else html
+        sprite_defs = cls.get_sprite_defs((i for i in uses if i not in inlined), sprite)
+        
+        baseline = len(html.encode()) + len(str(cls.get_sprite_defs(uses, sprite)).encode())
+        saved = baseline - len(rewritten.encode()) - len(str(sprite_defs).encode())
+        logger.debug(f"Inlined {len(inlined)} of {len(uses)} icons, saved {saved} bytes")
+        return rewritten, sprite_defs, saved
+    
+    @classmethod
+    def page_icon_ids(cls, html: str, sprite: Optional[_SpriteSnapshot] = None) -> Set[str]:
+        """Get the names of all icons referenced through <use> in rendered HTML"""
+        sprite = sprite or cls._load_sprite_file()
+        return {sprite.icon_name(match.group(2)) for match in _USE_RE.finditer(html)}
+    
+    @classmethod
+    def link_bundle(cls, html: str, route: str,
+                    sprite: Optional[_SpriteSnapshot] = None) -> Tuple[str, NotStr]:
+        """Point icon references at the route's prebuilt sprite bundle
+        
+        Icons missing from the bundle, e.g. ones added since usage was recorded,
+        still get inline defs. Routes without a bundle fall back to sprite rendering.
+        """
+        sprite = sprite or cls._load_sprite_file()
+        icon_ids = cls.page_icon_ids(html, sprite)
+        bundle = sprite.manifest.get("bundles", {}).get(route)
+        if not bundle:
+            return html, cls.get_sprite_defs(icon_ids, sprite)
+        
+        bundled = set(bundle["icons"])
+        href = f"{config.static_url.rstrip('/')}/{bundle['file']}"
+        
+        def replace(match: re.Match) -> str:
+            if sprite.icon_name(match.group(2)) not in bundled:
+                return match.group(0)
+            return f'<svg class="{match.group(1)}" data-icon><use href="{href}#{match.group(2)}"/></svg>'
+        
+        html = _USE_RE.sub(replace, html)
+        return html, cls.get_sprite_defs(icon_ids - bundled, sprite)
+    
+    @staticmethod
+    def _inline_svg(classes: str, view_box: str, body: str) -> str:
+        return f'<svg class="{classes}" data-icon viewBox="{view_box}">{body}</svg>'
+    
     @classmethod
     def _get_og_classes(cls, symbol_xml: str) -> list[str]:
         """Extract OG styling classes from symbol XML"""
@@ -223,34 +444,57 @@ class Icon(metaclass=IconMeta):
             
         return classes
     
-    def __ft__(self) -> NotStr:
+    def _base_classes(self, mask: bool = False) -> str:
+        """Get the merged base classes, pre-resolved at configure() time for enum sizes and styles"""
+        tables = config.tables
+        base = (tables.mask if mask else tables.base).get((self.size, self.style))
+        if base is not None:
+            return base
+        
         base_classes = ["inline-block"]
         
         # Add base styling classes
         if self.style != Style.OG:
             style_classes = (
-                self.style.value 
+                tables.styles.get(self.style, self.style.value)
                 if isinstance(self.style, Style) 
                 else self.style
             )
+            if mask:
+                style_classes = mask_style_classes(style_classes)
             base_classes.extend(style_classes.split())
         
         # Add size classes
         size_classes = (
-            config.sizes[self.size] 
-            if isinstance(self.size, Size) 
+            tables.sizes.get(self.size, "")
+            if isinstance(self.size, Size)
             else self.size
         )
         base_classes.append(size_classes)
-        
+        return tw_merge(" ".join(base_classes))
+    
+    def __ft__(self) -> NotStr:
         # Merge with custom classes
-        final_classes = tw_merge(" ".join(base_classes), self.cls)
+        mask = config.render_mode == "mask"
+        base_classes = self._base_classes(mask)
+        final_classes = tw_merge(base_classes, self.cls) if self.cls else base_classes
         
         icon_id = str(self.name).replace("/", ".")
+        
+        # Mask icons are drawn entirely by the cached stylesheet
+        if mask:
+            return NotStr(
+                f'<span class="ft-icon {css_class_name(icon_id)} {final_classes}" data-icon></span>'
+            )
+        
         self._page_icons.add(icon_id)
         
+        # Reference the compact id when the sprite was built with short ids. The
+        # sprite isn't loaded here, so renders without one stay cheap and quiet
+        ref = self._current_sprite().ref(icon_id)
+        
         return NotStr(
             f"""<svg class="{final_classes}" data-icon>
-                <use href="#{icon_id}"/>
+                <use href="#{ref}"/>
             </svg>"""
         )
\ No newline at end of file
@@ -1,6 +1,10 @@
 from fasthtml.common import Middleware, FT
-from .icon import Icon
+from .icon import Icon, _SpriteSnapshot, _request_sprite
+from .config import config
+from starlette.routing import BaseRoute, Match
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Dict, List, Optional, Set, Tuple
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -8,22 +12,32 @@ logger = logging.getLogger(__name__)
 class _IconSpriteMiddleware:
     def __init__(self, app: ASGIApp):
         self.app = app
+        self._recorded: Dict[str, Set[str]] = {}
         try:
             Icon._load_sprite_file()
             logger.info("Successfully loaded sprite file in middleware")
+            if config.reload_interval:
+                Icon.watch_sprite_file()
         except Exception as e:
             logger.error(f"Failed to load sprite file: {e}")
             raise
             
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
-        if scope["type"] != "http" or not self._should_process(scope):
+        if (scope["type"] != "http" or config.render_mode == "mask"
+                or not self._should_process(scope)):
             return await self.app(scope, receive, send)
 
+        # Resolved before the app runs, as mounted apps rewrite the shared scope
+        route = (self._route_template(scope)
+                 if config.usage_log or config.render_mode == "bundle" else "")
+        # Read the sprite once, so a hot reload can't change it mid-response
+        sprite = Icon._load_sprite_file()
         response_headers = {}
+        start_message: Message = {}
         body_buffer = b""
 
         async def wrapped_send(message: Message):
-            nonlocal body_buffer
+            nonlocal body_buffer, start_message
             
             if message["type"] == "http.response.start":
                 # Store headers to check content type
@@ -31,45 +45,102 @@ class _IconSpriteMiddleware:
                     k.decode().lower(): v.decode().lower()
                     for k, v in message.get("headers", [])
                 })
-                # Remove content-length header since we'll modify the body
-                message["headers"] = [
-                    (k, v) for k, v in message.get("headers", [])
-                    if k.decode().lower() != "content-length"
-                ]
-                await send(message)
+                if not response_headers.get("content-type", "").startswith("text/html"):
+                    await send(message)
+                    return
+                # Hold back HTML headers until the rewritten body size is known
+                start_message = message
                 
-            elif message["type"] == "http.response.body":
-                if response_headers.get("content-type", "").startswith("text/html"):
-                    body_buffer += message.get("body", b"")
-                    
-                    if not message.get("more_body", False):
-                        # Process complete HTML response
-                        try:
-                            decoded_body = body_buffer.decode()
-                            if "<body" in decoded_body and Icon._page_icons:
-                                sprite_defs = Icon.get_sprite_defs()
-                                body_pos = decoded_body.find("<body") 
-                                body_pos += decoded_body[body_pos:].find(">") + 1
-                                modified_body = (
-                                    decoded_body[:body_pos] + 
-                                    str(sprite_defs) + 
-                                    decoded_body[body_pos:]
-                                )
-                                await send({
-                                    "type": "http.response.body",
-                                    "body": modified_body.encode()
-                                })
-                                return
-                        except UnicodeDecodeError:
-                            pass  # Fall through to original send
-                        
-                # Forward unmodified response for non-HTML or errors
-                await send(message)
+            elif message["type"] == "http.response.body" and start_message:
+                body_buffer += message.get("body", b"")
+                if message.get("more_body", False):
+                    return
+                
+                body, extra_headers = self._inject_sprites(body_buffer, route, sprite)
+                start_message["headers"] = [
+                    (k, v) for k, v in start_message.get("headers", [])
+                    if k.decode().lower() != "content-length"
+                ] + [(b"content-length", str(len(body)).encode())] + extra_headers
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
                 
             else:
                 await send(message)
 
-        await self.app(scope, receive, wrapped_send)
+        # Icons rendered by the app reference ids from the same snapshot
+        token = _request_sprite.set(sprite)
+        try:
+            await self.app(scope, receive, wrapped_send)
+        finally:
+            _request_sprite.reset(token)
+
+    def _inject_sprites(self, body: bytes, route: str,
+                        sprite: _SpriteSnapshot) -> Tuple[bytes, List[Tuple[bytes, bytes]]]:
+        """Inject the page's sprite defs after <body>, returning extra headers to send"""
+        try:
+            decoded_body = body.decode()
+        except UnicodeDecodeError:
+            return body, []
+        
+        if "<body" not in decoded_body:
+            return body, []
+        
+        if config.usage_log:
+            self._record_usage(route, Icon.page_icon_ids(decoded_body, sprite))
+        
+        extra_headers = []
+        if config.render_mode == "bundle":
+            decoded_body, sprite_defs = Icon.link_bundle(decoded_body, route, sprite)
+        elif config.render_mode == "adaptive":
+            decoded_body, sprite_defs, saved = Icon.render_adaptive(decoded_body, sprite)
+            extra_headers.append((b"x-icon-bytes-saved", str(saved).encode()))
+        elif Icon._page_icons:
+            sprite_defs = Icon.get_sprite_defs(sprite=sprite)
+        else:
+            return body, []
+        
+        body_pos = decoded_body.find("<body") 
+        body_pos += decoded_body[body_pos:].find(">") + 1
+        modified_body = (
+            decoded_body[:body_pos] + 
+            str(sprite_defs) + 
+            decoded_body[body_pos:]
+        )
+        return modified_body.encode(), extra_headers
+
+    def _record_usage(self, route: str, icon_ids: Set[str]) -> None:
+        """Append the route's icons to the usage log when it renders new ones"""
+        recorded = self._recorded.setdefault(route, set())
+        if icon_ids <= recorded:
+            return
+        recorded |= icon_ids
+        
+        with open(config.usage_log, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"route": route, "icons": sorted(icon_ids)}) + "\n")
+
+    @classmethod
+    def _route_template(cls, scope: Scope) -> str:
+        """Get the matched route's path template, falling back to the request path"""
+        router = getattr(scope.get("app"), "router", None)
+        template = cls._match_template(getattr(router, "routes", []), scope)
+        return template or scope.get("path", "")
+
+    @classmethod
+    def _match_template(cls, routes: List[BaseRoute], scope: Scope) -> Optional[str]:
+        """Find the path template of the first route that fully matches, descending into mounts
+        
+        Hosts have sub-routes but no path, so they add no prefix to the template.
+        """
+        for route in routes:
+            match, child_scope = route.matches(scope)
+            if match != Match.FULL:
+                continue
+            sub_routes = getattr(route, "routes", None)
+            if not sub_routes:
+                return getattr(route, "path", None)
+            template = cls._match_template(sub_routes, {**scope, **child_scope})
+            return getattr(route, "path", "") + template if template else None
+        return None
 
     def _should_process(self, scope: Scope) -> bool:
         """Determine if request should be processed by this middleware"""
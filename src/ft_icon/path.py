@@ -1,5 +1,101 @@
 from fasthtml.common import *
 from fasthtml.svg import *
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of coordinates taken by each absolute path command
+_ARITY = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'A': 7, 'Z': 0}
+
+def _formatter(precision=None):
+    "Number formatter for path data, trimming trailing zeros."
+    # Without a precision, round away float noise such as 0.30000000000000004
+    digits = 12 if precision is None else precision
+    def fmt(v):
+        if not math.isfinite(v): raise ValueError(f"Path coordinates must be finite, got {v}")
+        v = round(v, digits)
+        if v == int(v): return str(int(v))
+        return f'{v:.{digits}f}'.rstrip('0').rstrip('.')
+    return fmt
+
+def _coords(values, precision=None):
+    "Coordinates as a list of floats, rounded in bulk when NumPy is available."
+    if np is not None:
+        values = np.asarray(values, dtype=float)
+        return (values if precision is None else np.round(values, precision)).tolist()
+    return [float(v) if precision is None else round(v, precision) for v in values]
+
+def _decimate(xs, ys, tolerance):
+    "Drop points closer than tolerance to the last kept point, keeping the endpoints."
+    if len(xs) < 3: return xs, ys
+    keep_x, keep_y, tol2 = [xs[0]], [ys[0]], tolerance * tolerance
+    for x, y in zip(xs[1:-1], ys[1:-1]):
+        if (x - keep_x[-1]) ** 2 + (y - keep_y[-1]) ** 2 >= tol2:
+            keep_x.append(x)
+            keep_y.append(y)
+    keep_x.append(xs[-1])
+    keep_y.append(ys[-1])
+    return keep_x, keep_y
+
+def polyline_data(xs, ys, precision=None, relative=False, tolerance=None):
+    "Path data for a polyline through the points, built in a single pass."
+    xs, ys = _coords(xs, precision), _coords(ys, precision)
+    if len(xs) != len(ys): raise ValueError("xs and ys must have the same length")
+    if not xs: return ''
+    if tolerance: xs, ys = _decimate(xs, ys, tolerance)
+    fmt = _formatter(precision)
+    if relative:
+        if np is not None:
+            dxs, dys = np.diff(xs).tolist(), np.diff(ys).tolist()
+        else:
+            dxs = [b - a for a, b in zip(xs, xs[1:])]
+            dys = [b - a for a, b in zip(ys, ys[1:])]
+        rest = ' '.join(f'{fmt(dx)} {fmt(dy)}' for dx, dy in zip(dxs, dys))
+        cmd = 'l'
+    else:
+        rest = ' '.join(f'{fmt(x)} {fmt(y)}' for x, y in zip(xs[1:], ys[1:]))
+        cmd = 'L'
+    start = f'M{fmt(xs[0])} {fmt(ys[0])}'
+    return f'{start}{cmd}{rest}' if rest else start
+
+def path_data(cmds, coords, precision=None, relative=False):
+    "Path data for absolute commands (e.g. 'MLLCZ') with their coordinates flattened in order."
+    coords = _coords(coords, precision)
+    fmt = _formatter(precision)
+    parts, prev, i = [], None, 0
+    cx = cy = sx = sy = 0.0
+    for cmd in cmds:
+        cmd = cmd.upper()
+        if cmd not in _ARITY: raise ValueError(f"Unknown path command: {cmd}")
+        args = coords[i:i + _ARITY[cmd]]
+        if len(args) != _ARITY[cmd]: raise ValueError(f"Not enough coordinates for command {cmd}")
+        i += _ARITY[cmd]
+        out = list(args)
+        if relative and cmd != 'Z':
+            if cmd == 'H': out[0] -= cx
+            elif cmd == 'V': out[0] -= cy
+            elif cmd == 'A': out[5] -= cx; out[6] -= cy
+            else:
+                for j in range(0, len(out), 2):
+                    out[j] -= cx
+                    out[j + 1] -= cy
+        # Track the current point and subpath start for relative encoding
+        if cmd == 'H': cx = args[0]
+        elif cmd == 'V': cy = args[0]
+        elif cmd == 'Z': cx, cy = sx, sy
+        else: cx, cy = args[-2], args[-1]
+        if cmd == 'M': sx, sy = cx, cy
+        letter = cmd.lower() if relative else cmd
+        # Repeated commands can omit their letter, except after a move (implicit lineto)
+        if letter != prev or cmd in 'MZ': parts.append(letter)
+        elif parts: parts.append(' ')
+        parts.append(' '.join(fmt(v) for v in out))
+        prev = letter
+    if i != len(coords): raise ValueError("Too many coordinates for the given commands")
+    return ''.join(parts)
 
 class ExtendedPathFT(PathFT):
     def l(self, x, y):
@@ -37,6 +133,14 @@ class ExtendedPathFT(PathFT):
     def v(self, dy):
         "Relative vertical line to."
         return self._append_cmd(f'v{dy}')
+
+    def polyline(self, xs, ys, precision=None, relative=False, tolerance=None):
+        "Move to the first point and line through the rest, in one pass."
+        return self._append_cmd(polyline_data(xs, ys, precision, relative, tolerance))
+
+    def commands(self, cmds, coords, precision=None, relative=False):
+        "Bulk absolute commands with their flattened coordinates, in one pass."
+        return self._append_cmd(path_data(cmds, coords, precision, relative))
     
 # Override the original Path function with our extended version
 def Path(*args, **kwargs):
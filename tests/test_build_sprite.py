@@ -0,0 +1,72 @@
+import ast
+import io
+import json
+import re
+import xml.etree.ElementTree as ET
+
+from ft_icon.build_sprite import (
+    _assign_short_ids, _generate_types, _iter_collection_symbols, build_sprites,
+)
+
+
+def _write_collection(tmp_path, **collection):
+    path = tmp_path / "mdi.json"
+    path.write_text(json.dumps({"prefix": "mdi", "width": 24, "height": 24, **collection}))
+    return path
+
+def test_hidden_icons_and_aliases_are_compiled(tmp_path):
+    path = _write_collection(
+        tmp_path,
+        icons={"old-name": {"body": '<path d="M0 0h1"/>', "hidden": True}},
+        aliases={"older-name": {"parent": "old-name", "hidden": True}},
+    )
+    names = [name for _, name, _ in _iter_collection_symbols(path, ["old-name", "older-name"])]
+    assert names == ["old-name", "older-name"]
+
+def test_alias_rotation_swaps_view_box(tmp_path):
+    path = _write_collection(
+        tmp_path,
+        icons={"wide": {"body": '<path d="M0 0h32"/>', "width": 32}},
+        aliases={"tall": {"parent": "wide", "rotate": 1}},
+    )
+    symbols = {name: symbol for _, name, symbol in _iter_collection_symbols(path)}
+    assert symbols["wide"].get("viewBox") == "0 0 32 24"
+    assert symbols["tall"].get("viewBox") == "0 0 24 32"
+    assert symbols["tall"].get("id") == "mdi.tall"
+
+def test_short_ids_are_prefixed_and_stable():
+    symbols = [("icons", name, ET.Element("symbol", id=f"icons.{name}")) for name in ("a", "g", "home")]
+    ids = {"icons.home": "g"}
+    assigned = [symbol.get("id") for _, _, symbol in _assign_short_ids(symbols, ids)]
+    # The unprefixed id from an older manifest keeps its index
+    assert assigned == ["_h", "_i", "_g"]
+    assert ids == {"icons.home": "_g", "icons.a": "_h", "icons.g": "_i"}
+
+def test_short_ids_dont_clash_with_body_ids(tmp_path, monkeypatch):
+    output_dir = tmp_path / "static"
+    monkeypatch.setenv("FT_ICON_OUTPUT_DIR", str(output_dir))
+    path = _write_collection(tmp_path, icons={
+        name: {"body": '<linearGradient id="g"/><path fill="url(#g)" d="M0 0h1"/>'}
+        for name in [f"icon-{i}" for i in range(20)]
+    })
+    build_sprites(tmp_path / "missing", output_dir, collections=[path], short_ids=True)
+    symbol_ids = re.findall(r'<symbol id="([^"]+)"', (output_dir / "sprite.svg").read_text())
+    assert len(symbol_ids) == 20
+    assert all(symbol_id.startswith("_") for symbol_id in symbol_ids)
+    assert "g" not in symbol_ids
+
+def test_type_stubs_only_declare_resolvable_methods():
+    symbols = [
+        ("icons", "home", ET.Element("symbol", id="icons.home")),
+        ("icons", "3d-rotation", ET.Element("symbol", id="icons.3d-rotation")),
+        ("icons", "class", ET.Element("symbol", id="icons.class")),
+        ("icons", "arrow_left", ET.Element("symbol", id="icons.arrow-left")),
+        ("mdi", "home", ET.Element("symbol", id="mdi.home")),
+    ]
+    stub = io.StringIO()
+    assert len(list(_generate_types(stub, symbols))) == len(symbols)
+    tree = ast.parse(stub.getvalue())
+    protocol = next(node for node in tree.body if isinstance(node, ast.ClassDef))
+    assert [node.name for node in protocol.body if isinstance(node, ast.FunctionDef)] == ["home", "arrow_left"]
+    for _, _, symbol in symbols:
+        assert f'"{symbol.get("id")}"' in stub.getvalue()
@@ -0,0 +1,39 @@
+from ft_icon import Icon, Size, Style
+from ft_icon.config import IconConfig, config, configure
+
+
+def test_configure_publishes_one_table_snapshot(monkeypatch):
+    monkeypatch.setattr(config, "tables", config.tables)
+    before = config.tables
+    
+    configure(sizes={"test_huge": "h-20 w-20", "sm": "h-4 w-4"}, styles={"test_fancy": "fill-primary"})
+    after = config.tables
+    
+    assert after is not before
+    assert Size.TEST_HUGE in after.sizes and Style.TEST_FANCY in after.styles
+    assert after.base[(Size.TEST_HUGE, Style.TEST_FANCY)] == "inline-block fill-primary h-20 w-20"
+    assert after.base[(Size.SM, Style.OG)] == "inline-block h-4 w-4"
+    assert after.mask[(Size.TEST_HUGE, Style.TEST_FANCY)] == "inline-block text-primary h-20 w-20"
+    # The previous snapshot is left untouched
+    assert Size.TEST_HUGE not in before.sizes
+    assert before.base[(Size.SM, Style.OG)] == "inline-block h-5 w-5"
+
+def test_new_members_register_after_tables_publish(monkeypatch):
+    monkeypatch.setattr(config, "tables", config.tables)
+    registered_at_publish = []
+    
+    def record(self, name, value):
+        if name == "tables":
+            registered_at_publish.append("TEST_LATE" in Size.__members__)
+        object.__setattr__(self, name, value)
+    monkeypatch.setattr(IconConfig, "__setattr__", record)
+    
+    configure(sizes={"test_late": "h-12 w-12"})
+    assert registered_at_publish == [False]
+    assert Size.TEST_LATE in config.tables.sizes
+
+def test_render_uses_configured_classes(monkeypatch):
+    monkeypatch.setattr(config, "tables", config.tables)
+    configure(sizes={"test_render": "h-14 w-14"})
+    icon = Icon(name="icons.home", size=Size.TEST_RENDER, style=Style.OUTLINE)
+    assert icon._base_classes() == "inline-block fill-none stroke-2 stroke-current h-14 w-14"
@@ -0,0 +1,67 @@
+from fasthtml.common import Div, fast_app
+from starlette.testclient import TestClient
+
+from ft_icon import Icon
+from ft_icon.build_sprite import build_sprites
+from ft_icon.icon import _SpriteSnapshot
+from ft_icon.middleware import IconSpriteMiddleware
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M{0} 0h1"/></svg>'
+
+
+def _build(icons_dir, output_dir, *names):
+    for i, name in enumerate(names):
+        (icons_dir / f"{name}.svg").write_text(SVG.format(i))
+    build_sprites(icons_dir, output_dir, short_ids=True)
+
+def test_reload_publishes_symbols_and_ids_together(tmp_path, monkeypatch):
+    icons_dir, output_dir = tmp_path / "icons", tmp_path / "static"
+    icons_dir.mkdir()
+    monkeypatch.setenv("FT_ICON_OUTPUT_DIR", str(output_dir))
+    monkeypatch.setattr(Icon, "_sprite", _SpriteSnapshot())
+    
+    _build(icons_dir, output_dir, "home", "user")
+    assert Icon.reload_sprites()
+    before = Icon._sprite
+    
+    _build(icons_dir, output_dir, "search")
+    assert Icon.reload_sprites()
+    after = Icon._sprite
+    
+    assert after is not before
+    assert "icons.search" not in before.symbols
+    assert set(after.symbols) == set(after.short_ids) == {"icons.home", "icons.user", "icons.search"}
+    for name, short_id in after.short_ids.items():
+        assert after.names[short_id] == name
+        assert f'id="{short_id}"' in after.symbols[name]
+    # Ids are kept across builds
+    assert after.short_ids["icons.home"] == before.short_ids["icons.home"]
+    assert not Icon.reload_sprites()
+
+def test_response_uses_one_snapshot(tmp_path, monkeypatch):
+    def snapshot(ref):
+        return _SpriteSnapshot(
+            symbols={"icons.home": f'<symbol id="{ref}" viewBox="0 0 24 24"><path d="M0 0"/></symbol>'},
+            short_ids={"icons.home": ref}, names={ref: "icons.home"}, stamp=(0, 0),
+        )
+    monkeypatch.setattr(Icon, "_sprite", snapshot("_old"))
+    app, rt = fast_app(middleware=[IconSpriteMiddleware], key_fname=str(tmp_path / ".sesskey"))
+    
+    @rt("/")
+    def get():
+        # A reload landing mid-render must not change the ids in this response
+        Icon._sprite = snapshot("_new")
+        return Div(Icon(name="icons.home"))
+    
+    html = TestClient(app).get("/").text
+    assert '<use href="#_old"/>' in html
+    assert '<symbol id="_old"' in html
+    assert "_new" not in html
+
+def test_render_without_sprite_doesnt_load_it(tmp_path, monkeypatch):
+    monkeypatch.setenv("FT_ICON_OUTPUT_DIR", str(tmp_path))
+    monkeypatch.setattr(Icon, "_sprite", _SpriteSnapshot())
+    def fail(*args, **kwargs):
+        raise AssertionError("sprite loaded during render")
+    monkeypatch.setattr(Icon, "reload_sprites", fail)
+    assert '<use href="#icons.home"/>' in str(Icon(name="icons.home").__ft__())
@@ -0,0 +1,31 @@
+from starlette.applications import Starlette
+from starlette.routing import Host, Mount, Route, Router
+
+from ft_icon.middleware import _IconSpriteMiddleware
+
+
+def _scope(path, host="testserver"):
+    return {"type": "http", "method": "GET", "path": path, "root_path": "",
+            "headers": [(b"host", host.encode())]}
+
+def _template(routes, scope):
+    return _IconSpriteMiddleware._route_template({**scope, "app": Starlette(routes=routes)})
+
+def _endpoint(request):
+    pass
+
+def test_route_template_for_plain_routes():
+    routes = [Route("/items/{id}", _endpoint)]
+    assert _template(routes, _scope("/items/3")) == "/items/{id}"
+
+def test_route_template_includes_mount_prefix():
+    routes = [Mount("/sub", routes=[Route("/things/{slug}", _endpoint)])]
+    assert _template(routes, _scope("/sub/things/a")) == "/sub/things/{slug}"
+
+def test_route_template_through_host():
+    routes = [Host("api.example.com", app=Router([Route("/users/{id}", _endpoint)]))]
+    assert _template(routes, _scope("/users/1", "api.example.com")) == "/users/{id}"
+    assert _template(routes, _scope("/users/1")) == "/users/1"
+
+def test_route_template_falls_back_to_path():
+    assert _template([Route("/", _endpoint)], _scope("/missing")) == "/missing"
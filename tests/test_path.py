@@ -0,0 +1,47 @@
+import math
+
+import pytest
+
+from ft_icon.path import path_data, polyline_data
+
+
+def test_polyline_precision_zero_keeps_digits():
+    assert polyline_data([10, 20, 100], [0, 50, 300], precision=0) == 'M10 0L20 50 100 300'
+    assert polyline_data([0.4, 1.6], [-0.4, 9.5], precision=0) == 'M0 0L2 10'
+
+def test_polyline_precision_one_trims_zeros():
+    assert polyline_data([1.25, 2.0, 3.04], [0.5, 10.0, -2.06], precision=1) == 'M1.2 0.5L2 10 3 -2.1'
+
+def test_polyline_default_precision():
+    assert polyline_data([1, 2.5], [3, 4]) == 'M1 3L2.5 4'
+    assert polyline_data([0.1 + 0.2], [1 / 3]) == 'M0.3 0.333333333333'
+
+def test_polyline_relative_has_no_float_noise():
+    assert polyline_data([0.1, 0.2, 0.3], [0, 0, 0], relative=True) == 'M0.1 0l0.1 0 0.1 0'
+    assert polyline_data([10, 20, 100], [0, 50, 300], precision=0, relative=True) == 'M10 0l10 50 80 250'
+
+def test_polyline_tolerance_keeps_endpoints():
+    assert polyline_data([0, 0.1, 5, 5.1], [0, 0, 0, 0], tolerance=1) == 'M0 0L5 0 5.1 0'
+
+@pytest.mark.parametrize('bad', [math.nan, math.inf, -math.inf])
+def test_non_finite_coordinates_rejected(bad):
+    with pytest.raises(ValueError, match='finite'):
+        polyline_data([0, bad], [0, 1])
+    with pytest.raises(ValueError, match='finite'):
+        path_data('ML', [0, 0, bad, 1], precision=0)
+
+def test_path_data_absolute_and_relative():
+    cmds, coords = 'MLHVZ', [10, 10, 20, 10, 30, 40]
+    assert path_data(cmds, coords) == 'M10 10L20 10H30V40Z'
+    assert path_data(cmds, coords, relative=True) == 'm10 10l10 0h10v30z'
+
+def test_path_data_repeated_commands_share_letter():
+    assert path_data('MLL', [0, 0, 1.26, 2, 3, 4], precision=1) == 'M0 0L1.3 2 3 4'
+
+def test_path_data_validates_coordinate_count():
+    with pytest.raises(ValueError, match='Not enough'):
+        path_data('ML', [0, 0, 1])
+    with pytest.raises(ValueError, match='Too many'):
+        path_data('M', [0, 0, 1])
+    with pytest.raises(ValueError, match='Unknown'):
+        path_data('X', [])